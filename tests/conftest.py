@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration for PyHDLio tests.
+"""
+
+import os
+import sys
+
+# PyHDLio is normally installed in editable mode (see requirements.txt); fall
+# back to the submodule checkout so tests still import without it. This runs
+# once per session rather than on every test module import.
+_PYHDLIO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'PyHDLio'))
+if _PYHDLIO_DIR not in sys.path:
+    sys.path.insert(0, _PYHDLIO_DIR)
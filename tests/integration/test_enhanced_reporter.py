@@ -2,44 +2,37 @@
 Test enhanced reporting functionality with pyVHDLModel VHDL structures
 """
 
+import io
 import unittest
-import os
-import sys
-
-# Add PyHDLio package to path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'PyHDLio'))
-
-# Add tests directory to path for utility imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from pyhdlio.vhdl.model import Document
-from utils.reporter import report_pyvhdlmodel_entities, report_entity
+from tests.utils.documents import document_from_file
+from tests.utils.paths import HAS_SAMPLE_VHDL, SAMPLE_VHDL, requires_sample
+from tests.utils.reporter import report_pyvhdlmodel_entities, report_entity, write_pyvhdlmodel_entities
 
 # pyVHDLModel imports
 from pyVHDLModel.DesignUnit import Entity as PyVHDLModelEntity
 
+
 class TestEnhancedReporter(unittest.TestCase):
     """Test enhanced reporting functionality using pyVHDLModel objects."""
 
-    def setUp(self):
-        """Set up test cases."""
-        self.simple_vhdl = os.path.join(
-            os.path.dirname(__file__), '..', '..', 'PyHDLio', 'examples', 'vhdl_in', 'sample.vhd'
-        )
+    @classmethod
+    def setUpClass(cls):
+        """Set up test cases from the shared parse of the sample VHDL file."""
+        cls.simple_vhdl = SAMPLE_VHDL
 
         # Parse the simple VHDL file using Document API
-        if os.path.exists(self.simple_vhdl):
-            self.simple_document = Document.FromFile(self.simple_vhdl)
-            entities = list(self.simple_document.Entities.values())
+        if HAS_SAMPLE_VHDL:
+            cls.simple_document = document_from_file(cls.simple_vhdl)
+            entities = list(cls.simple_document.Entities.values())
             # Use the processor entity which has generics and complex ports
-            self.simple_entity = entities[1] if len(entities) > 1 else entities[0] if entities else None
+            cls.simple_entity = entities[1] if len(entities) > 1 else entities[0] if entities else None
         else:
-            self.simple_document = None
-            self.simple_entity = None
+            cls.simple_document = None
+            cls.simple_entity = None
 
-    @unittest.skipUnless(os.path.exists(os.path.join(
-        os.path.dirname(__file__), '..', '..', 'PyHDLio', 'examples', 'vhdl_in', 'sample.vhd'
-    )), "Sample VHDL file not found")
+    @requires_sample
     def test_pyvhdlmodel_entity_reporting(self):
         """Test pyVHDLModel entity reporting."""
         report = report_entity(self.simple_entity)
@@ -65,6 +58,7 @@ class TestEnhancedReporter(unittest.TestCase):
         # Check port grouping
         self.assertIn("Ports (grouped):", report)
 
+    @requires_sample
     def test_document_entities_reporting(self):
         """Test reporting on all entities in a document."""
         entities = list(self.simple_document.Entities.values())
@@ -76,6 +70,59 @@ class TestEnhancedReporter(unittest.TestCase):
         self.assertIn("clk", report)
         self.assertIn("inst_addr", report)
 
+    def test_streaming_writer_matches_report(self):
+        """Test the streaming writer produces the same text as the string report."""
+        vhdl_code = """
+        entity stream_entity is
+          generic (
+            DEPTH : natural := 4
+          );
+          port (
+            clk : in std_logic;
+            q : out std_logic
+          );
+        end entity;
+        """
+
+        document = Document.FromStr(vhdl_code)
+        entities = list(document.Entities.values())
+
+        out = io.StringIO()
+        write_pyvhdlmodel_entities(entities, out)
+        self.assertEqual(out.getvalue(), report_pyvhdlmodel_entities(entities) + "\n")
+
+        out = io.StringIO()
+        write_pyvhdlmodel_entities([], out)
+        self.assertEqual(out.getvalue(), "No entities found.\n")
+
+    def test_entities_from_iterators(self):
+        """Test the entities report accepts generators and empty iterators."""
+        vhdl_code = """
+        entity first_entity is
+          port (
+            clk : in std_logic
+          );
+        end entity;
+
+        entity second_entity is
+        end entity;
+        """
+
+        document = Document.FromStr(vhdl_code)
+        entities = list(document.Entities.values())
+        expected = report_pyvhdlmodel_entities(entities)
+
+        # A generator is consumed once and reports every entity
+        report = report_pyvhdlmodel_entities(entity for entity in entities)
+        self.assertEqual(report, expected)
+        self.assertIn("Entity: first_entity", report)
+        self.assertIn("Entity: second_entity", report)
+
+        # Empty inputs, including None, report that there are no entities
+        self.assertEqual(report_pyvhdlmodel_entities(iter([])), "No entities found.")
+        self.assertEqual(report_pyvhdlmodel_entities(entity for entity in []), "No entities found.")
+        self.assertEqual(report_pyvhdlmodel_entities(None), "No entities found.")
+
     def test_empty_sections_handling(self):
         """Test reporting handles entities with missing sections gracefully."""
         # Create minimal VHDL entity
@@ -121,6 +168,7 @@ class TestEnhancedReporter(unittest.TestCase):
         self.assertIn("control", report)
         self.assertIn("inout", report)
 
+    @requires_sample
     def test_report_formatting(self):
         """Test that reports are properly formatted."""
         report = report_entity(self.simple_entity)
@@ -230,7 +278,3 @@ class TestEnhancedReporter(unittest.TestCase):
         
         # Check that package has declarative items
         self.assertGreater(len(packages[0].DeclaredItems), 0)
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
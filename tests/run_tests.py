@@ -4,6 +4,7 @@ Test Runner for PyHDLio Integration Tests
 Runs comprehensive tests for the PyHDLio + pyVHDLModel integration.
 """
 
+import io
 import unittest
 import sys
 import os
@@ -13,15 +14,18 @@ import os
 # Add PyHDLio package to path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'PyHDLio'))
 
-# Add tests directory to path for utility imports
-sys.path.insert(0, os.path.dirname(__file__))
+# Add repository root to path for test package imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-# Import all test modules
-from integration.test_enhanced_reporter import TestEnhancedReporter
-from integration.test_full_integration import TestFullIntegration
+from tests.utils.paths import HAS_SAMPLE_VHDL
 
 def create_test_suite():
     """Create a comprehensive test suite."""
+    # Test modules pull in the parser and pyVHDLModel, so they are only
+    # imported once tests are actually about to run (not for --help)
+    from tests.integration.test_enhanced_reporter import TestEnhancedReporter
+    from tests.integration.test_full_integration import TestFullIntegration
+
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
 
@@ -46,10 +50,7 @@ def run_tests(verbosity=2):
         print("WARNING: pyVHDLModel not available - some tests will be skipped")
 
     # Check test files
-    simple_vhdl = os.path.join(
-        os.path.dirname(__file__), '..', 'PyHDLio', 'examples', 'vhdl', 'simple', 'simple.vhd'
-    )
-    if os.path.exists(simple_vhdl):
+    if HAS_SAMPLE_VHDL:
         print("OK: Test VHDL files found")
     else:
         print("WARNING: Test VHDL files missing - some tests will be skipped")
@@ -58,37 +59,41 @@ def run_tests(verbosity=2):
 
     # Create and run test suite
     suite = create_test_suite()
-    runner = unittest.TextTestRunner(verbosity=verbosity)
+    # Test output is buffered per test and only shown for failures; in quiet
+    # mode the runner's own output is collected and written out in one go
+    stream = io.StringIO() if verbosity == 0 else sys.stderr
+    runner = unittest.TextTestRunner(stream=stream, verbosity=verbosity, buffer=True)
     result = runner.run(suite)
-
-    # Summary
-    print("\n" + "=" * 50)
-    print("Test Results Summary:")
-    print(f"   Tests run: {result.testsRun}")
-    print(f"   Failures: {len(result.failures)}")
-    print(f"   Errors: {len(result.errors)}")
-    print(f"   Skipped: {len(result.skipped)}")
+    if stream is not sys.stderr:
+        sys.stderr.write(stream.getvalue())
+
+    # Summary (assembled and written in a single call)
+    lines = [
+        "\n" + "=" * 50,
+        "Test Results Summary:",
+        f"   Tests run: {result.testsRun}",
+        f"   Failures: {len(result.failures)}",
+        f"   Errors: {len(result.errors)}",
+        f"   Skipped: {len(result.skipped)}",
+    ]
 
     if result.failures:
-        print("\nFailures:")
-        for test, traceback in result.failures:
-            print(f"   - {test}: {traceback.split(chr(10))[-2]}")
+        lines.append("\nFailures:")
+        lines.extend(f"   - {test}: {traceback.split(chr(10))[-2]}" for test, traceback in result.failures)
 
     if result.errors:
-        print("\nErrors:")
-        for test, traceback in result.errors:
-            print(f"   - {test}: {traceback.split(chr(10))[-2]}")
+        lines.append("\nErrors:")
+        lines.extend(f"   - {test}: {traceback.split(chr(10))[-2]}" for test, traceback in result.errors)
 
     if result.skipped:
-        print(f"\nSkipped {len(result.skipped)} tests (missing dependencies/files)")
+        lines.append(f"\nSkipped {len(result.skipped)} tests (missing dependencies/files)")
 
     # Overall result
-    if result.wasSuccessful():
-        print("\nAll tests passed!")
-        return True
-    else:
-        print("\nSome tests failed!")
-        return False
+    success = result.wasSuccessful()
+    lines.append("\nAll tests passed!" if success else "\nSome tests failed!")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    return success
 
 def main():
     """Main entry point."""
@@ -0,0 +1,25 @@
+"""
+Shared fixtures for the unit tests.
+"""
+
+import pytest
+import pyVHDLModel
+
+from tests.utils.documents import document_from_file
+from tests.utils.paths import LIFE_SIGNS_VHDL, ENTITY_WITH_PORTS_VHDL
+
+
+@pytest.fixture(scope="session")
+def life_signs_doc():
+    """pyVHDLModel Document for life_signs.vhd, parsed once per session."""
+    document = document_from_file(LIFE_SIGNS_VHDL)
+    assert isinstance(document, pyVHDLModel.Document)
+    return document
+
+
+@pytest.fixture(scope="session")
+def entity_with_ports_doc():
+    """pyVHDLModel Document for entity_with_ports.vhd, parsed once per session."""
+    document = document_from_file(ENTITY_WITH_PORTS_VHDL)
+    assert isinstance(document, pyVHDLModel.Document)
+    return document
@@ -1,32 +1,25 @@
 import pytest
 import os
-from PyHDLio.pyhdlio.vhdl.model import Document, VHDLSyntaxError
+import subprocess
+import sys
+from pyhdlio.vhdl.model import Document, VHDLSyntaxError
 import pyVHDLModel
+from tests.utils.paths import VHDL_FIXTURE_DIR, LIFE_SIGNS_VHDL
 from tests.utils.reporter import report_pyvhdlmodel_entities
 
 
 class TestVHDLParser:
     """Unit tests for VHDL parser functionality using pyVHDLModel objects."""
 
-    def setup_method(self):
-        """Setup common paths for all tests."""
-        self.fixture_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'fixtures', 'vhdl')
-        self.life_signs_path = os.path.join(self.fixture_dir, 'life_signs.vhd')
-        self.entity_with_ports_path = os.path.join(self.fixture_dir, 'entity_with_ports.vhd')
-
-    def test_parse_life_signs_vhdl_document(self):
+    def test_parse_life_signs_vhdl_document(self, life_signs_doc):
         """Test parsing the life_signs.vhd fixture returns pyVHDLModel Document."""
-        result = Document.FromFile(self.life_signs_path)
-        
-        # Check that result is a pyVHDLModel Document
-        assert isinstance(result, pyVHDLModel.Document)
+        # The fixture checks that the result is a pyVHDLModel Document
+        assert "life_signs" in life_signs_doc.Entities
         
-    def test_entity_reporting(self):
+    def test_entity_reporting(self, life_signs_doc):
         """Test entity reporting functionality with pyVHDLModel entities."""
-        result = Document.FromFile(self.life_signs_path)
-        
         # Get entities from Document
-        entities = list(result.Entities.values())
+        entities = list(life_signs_doc.Entities.values())
         
         # Test reporting
         report = report_pyvhdlmodel_entities(entities)
@@ -36,12 +29,10 @@ class TestVHDLParser:
         assert "Ports (grouped):" in report
         assert "None" in report  # Since this entity has no generics or ports
 
-    def test_entity_with_ports_and_generics(self):
+    def test_entity_with_ports_and_generics(self, entity_with_ports_doc):
         """Test parsing entity with ports and generics using pyVHDLModel objects."""
-        result = Document.FromFile(self.entity_with_ports_path)
-        
         # Get entities from Document
-        entities = list(result.Entities.values())
+        entities = list(entity_with_ports_doc.Entities.values())
         assert len(entities) == 1
 
         entity = entities[0]
@@ -49,42 +40,42 @@ class TestVHDLParser:
 
         # Check generics - pyVHDLModel structure
         assert len(entity.GenericItems) == 2
-        generic_names = [g.Identifiers[0] for g in entity.GenericItems]
-        assert "WIDTH" in generic_names
-        assert "DEPTH" in generic_names
+        generics = {g.Identifiers[0]: g for g in entity.GenericItems}
+        assert "WIDTH" in generics
+        assert "DEPTH" in generics
         
         # Verify generic details
-        width_generic = next(g for g in entity.GenericItems if g.Identifiers[0] == "WIDTH")
+        width_generic = generics["WIDTH"]
         assert "integer" in str(width_generic.Subtype).lower()
         assert width_generic.DefaultExpression is not None
         
-        depth_generic = next(g for g in entity.GenericItems if g.Identifiers[0] == "DEPTH")
+        depth_generic = generics["DEPTH"]
         assert "natural" in str(depth_generic.Subtype).lower()
         assert depth_generic.DefaultExpression is not None
 
         # Check ports - pyVHDLModel structure
         assert len(entity.PortItems) == 3
-        port_names = [p.Identifiers[0] for p in entity.PortItems]
-        assert "clk" in port_names
-        assert "reset" in port_names
-        assert "data" in port_names
+        ports = {p.Identifiers[0]: p for p in entity.PortItems}
+        assert "clk" in ports
+        assert "reset" in ports
+        assert "data" in ports
         
         # Verify port details
-        clk_port = next(p for p in entity.PortItems if p.Identifiers[0] == "clk")
+        clk_port = ports["clk"]
         assert clk_port.Mode == pyVHDLModel.Mode.In
         assert "std_logic" in str(clk_port.Subtype).lower()
         
-        reset_port = next(p for p in entity.PortItems if p.Identifiers[0] == "reset")
+        reset_port = ports["reset"]
         assert reset_port.Mode == pyVHDLModel.Mode.In
         assert "std_logic" in str(reset_port.Subtype).lower()
         
-        data_port = next(p for p in entity.PortItems if p.Identifiers[0] == "data")
+        data_port = ports["data"]
         assert data_port.Mode == pyVHDLModel.Mode.Out
         assert "std_logic_vector" in str(data_port.Subtype).lower()
         
     def test_parse_nonexistent_file(self):
         """Test that parsing a non-existent file raises appropriate exception."""
-        non_existent_path = os.path.join(self.fixture_dir, 'does_not_exist.vhd')
+        non_existent_path = os.path.join(VHDL_FIXTURE_DIR, 'does_not_exist.vhd')
         
         with pytest.raises(FileNotFoundError) as exc_info:
             Document.FromFile(non_existent_path)
@@ -95,7 +86,7 @@ class TestVHDLParser:
     def test_parse_vhdl_file_path_handling(self):
         """Test that the parser handles file paths correctly."""
         # Test with absolute path 
-        abs_path = os.path.abspath(self.life_signs_path)
+        abs_path = os.path.abspath(LIFE_SIGNS_VHDL)
         result = Document.FromFile(abs_path)
         assert isinstance(result, pyVHDLModel.Document)
         entities = list(result.Entities.values())
@@ -103,17 +94,19 @@ class TestVHDLParser:
         assert entities[0].Identifier == "life_signs"
         
         # Test with relative path
-        # Change to fixture directory and use relative path
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(self.fixture_dir)
-            result = Document.FromFile('life_signs.vhd')
-            assert isinstance(result, pyVHDLModel.Document)
-            entities = list(result.Entities.values())
-            assert len(entities) > 0
-            assert entities[0].Identifier == "life_signs"
-        finally:
-            os.chdir(original_cwd)
+        # Parsed in a child process started in the fixture directory, so this
+        # process never changes its working directory
+        script = (
+            "import pyVHDLModel\n"
+            "from pyhdlio.vhdl.model import Document\n"
+            "result = Document.FromFile('life_signs.vhd')\n"
+            "assert isinstance(result, pyVHDLModel.Document)\n"
+            "print(list(result.Entities.values())[0].Identifier)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        completed = subprocess.run([sys.executable, "-c", script], cwd=VHDL_FIXTURE_DIR,
+                                   env=env, check=True, capture_output=True, text=True)
+        assert completed.stdout.strip() == "life_signs"
 
     def test_string_parsing(self):
         """Test parsing VHDL code from string using pyVHDLModel objects."""
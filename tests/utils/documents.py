@@ -0,0 +1,42 @@
+"""
+Cached VHDL parsing for tests.
+
+Tests only read the pyVHDLModel Documents they get back, so a parsed file
+can be shared by every test that uses it instead of being re-parsed.
+"""
+
+import os
+from typing import Dict, Tuple
+
+from pyhdlio.vhdl.model import Document
+
+
+# Parsed Documents keyed by (absolute path, mtime_ns)
+_documents: Dict[Tuple[str, int], Document] = {}
+
+
+def document_from_file(path: str) -> Document:
+    """Parse a VHDL file once and return the shared Document.
+
+    Entries are keyed on the absolute path and modification time, so the
+    same file reached through different relative paths shares one parse and
+    an edited file is parsed again.
+
+    Args:
+        path: Path to the VHDL file
+
+    Returns:
+        pyVHDLModel Document for the file
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        # Leave reporting of missing/unreadable files to Document.FromFile
+        return Document.FromFile(path)
+    # The absolute path is only the cache key; the path given by the first
+    # caller is what gets parsed, exactly as a direct Document.FromFile call
+    key = (os.path.abspath(path), mtime_ns)
+    document = _documents.get(key)
+    if document is None:
+        document = _documents[key] = Document.FromFile(path)
+    return document
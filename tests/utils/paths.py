@@ -0,0 +1,24 @@
+"""
+Locations of VHDL sources used by tests.
+
+Paths are resolved once at import, relative to this file, so tests do not
+depend on the current working directory.
+"""
+
+import os
+import unittest
+
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Sample design shipped with the PyHDLio examples
+SAMPLE_VHDL = os.path.join(REPO_DIR, 'PyHDLio', 'examples', 'vhdl_in', 'sample.vhd')
+HAS_SAMPLE_VHDL = os.path.exists(SAMPLE_VHDL)
+
+# Skips a test when the sample is missing; class setup still runs, so it
+# should check HAS_SAMPLE_VHDL before parsing the sample
+requires_sample = unittest.skipUnless(HAS_SAMPLE_VHDL, "Sample VHDL file not found")
+
+# Fixtures bundled with the tests
+VHDL_FIXTURE_DIR = os.path.join(REPO_DIR, 'tests', 'fixtures', 'vhdl')
+LIFE_SIGNS_VHDL = os.path.join(VHDL_FIXTURE_DIR, 'life_signs.vhd')
+ENTITY_WITH_PORTS_VHDL = os.path.join(VHDL_FIXTURE_DIR, 'entity_with_ports.vhd')
@@ -5,15 +5,178 @@ This module provides functions for generating formatted reports of VHDL entities
 for use in tests using pyVHDLModel objects.
 """
 
+from __future__ import annotations
+
 import sys
-import os
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, NamedTuple, Optional, Sequence, TextIO
+
+if TYPE_CHECKING:
+    # pyVHDLModel is only needed for annotations; entities passed in bring
+    # their own classes, so importing this module does not load pyVHDLModel
+    from pyVHDLModel import Mode
+    from pyVHDLModel.DesignUnit import Entity as PyVHDLModelEntity
+    from pyVHDLModel.Interface import PortSignalInterfaceItem
+
+
+# Port direction strings, filled once per Mode on first use rather than per port
+_MODE_STR: Dict[Mode, str] = {}
+
+# Default for attribute probes, distinct from an attribute that is set to None
+_MISSING = object()
+
+
+# Item text after the "- " prefix: name, type[, default] / name, direction, type
+_GENERIC_LINE = "%s: %s%s"
+_PORT_LINE = "%s: %s %s"
+
+# Interface item fields read by the reporters, fetched in one call per item
+_generic_fields = attrgetter("Identifiers", "Subtype", "DefaultExpression")
+_port_fields = attrgetter("Identifiers", "Mode", "Subtype")
+
+
+def _identifier(identifiers: Optional[Sequence[str]]) -> str:
+    """Return the first of an interface item's identifiers, or "unknown"."""
+    return identifiers[0] if identifiers else "unknown"
+
+
+def _direction(mode: Optional[Mode]) -> str:
+    """Return the lower-case direction for a port Mode, or "unknown"."""
+    if mode is None:
+        return "unknown"
+    try:
+        return _MODE_STR[mode]
+    except KeyError:
+        direction = _MODE_STR[mode] = str(mode.name).lower()
+        return direction
+
+
+def _type_string(subtype: object) -> str:
+    """Return the type string for a Subtype, or "unknown" if there is none.
+
+    Uses the _typeString stored by PyHDLio when present (even if it is None),
+    otherwise str(subtype). The Subtype is only read, so shared Documents are
+    never modified.
+    """
+    type_str = getattr(subtype, '_typeString', _MISSING)
+    if type_str is _MISSING:
+        return str(subtype) if subtype else "unknown"
+    return str(type_str)
+
+
+def _port_row(port: PortSignalInterfaceItem) -> str:
+    """Format the "name: direction type" text reported for a port."""
+    identifiers, mode, subtype = _port_fields(port)
+    return _PORT_LINE % (_identifier(identifiers), _direction(mode), _type_string(subtype))
+
+
+def _port_rows(entity: PyVHDLModelEntity) -> Dict[int, str]:
+    """Format every port of an entity once, keyed by port object id."""
+    return {id(port): _port_row(port) for port in entity.PortItems}
+
+
+class _Prefixes(NamedTuple):
+    """Indentation-dependent strings shared by the section reporters."""
+    indent: str
+    generics: str
+    ports_flat: str
+    ports_grouped: str
+    item: str
+    item_sep: str
+    none: str
+    group: str
+
+
+@lru_cache(maxsize=32)
+def _prefixes(indent: int) -> _Prefixes:
+    """Build the line prefixes and headers for an indentation level once."""
+    istr = " " * indent
+    return _Prefixes(
+        indent=istr,
+        generics=f"{istr}Generics:",
+        ports_flat=f"{istr}Ports (flat):",
+        ports_grouped=f"{istr}Ports (grouped):",
+        item=f"{istr}    - ",
+        item_sep=f"\n{istr}    - ",
+        none=f"{istr}    None",
+        group=f"{istr}  Group ",
+    )
+
+
+def _iter_generics(entity: PyVHDLModelEntity, indent: int) -> Iterator[str]:
+    """Yield the generics report for an entity: the header, then all items as one block."""
+    prefix = _prefixes(indent)
+    yield prefix.generics
+    if not entity.GenericItems:
+        yield prefix.none
+        return
+    tails = []
+    for identifiers, subtype, default_expression in map(_generic_fields, entity.GenericItems):
+        default = f" = {default_expression}" if default_expression else ""
+        tails.append(_GENERIC_LINE % (_identifier(identifiers), _type_string(subtype), default))
+    # Prefixes go in via the separator rather than into every element
+    yield prefix.item + prefix.item_sep.join(tails)
+
+
+def _iter_ports_flat(entity: PyVHDLModelEntity, indent: int,
+                     rows: Optional[Dict[int, str]] = None) -> Iterator[str]:
+    """Yield the flat ports report for an entity: the header, then all items as one block.
+
+    rows, from _port_rows(), lets callers share resolved ports between views.
+    """
+    prefix = _prefixes(indent)
+    yield prefix.ports_flat
+    if not entity.PortItems:
+        yield prefix.none
+        return
+    if rows is None:
+        rows = _port_rows(entity)
+    yield prefix.item + prefix.item_sep.join([rows[id(port)] for port in entity.PortItems])
+
+
+def _iter_ports_grouped(entity: PyVHDLModelEntity, indent: int,
+                        rows: Optional[Dict[int, str]] = None) -> Iterator[str]:
+    """Yield the grouped ports report for an entity: each group header, then its items as one block.
+
+    rows, from _port_rows(), lets callers share resolved ports between views.
+    """
+    prefix = _prefixes(indent)
+    yield prefix.ports_grouped
+    port_groups = getattr(entity, 'PortGroups', None)
+    if not port_groups:
+        yield prefix.none
+        return
+    if rows is None:
+        rows = _port_rows(entity)
+    for i, group in enumerate(port_groups, 1):
+        yield f"{prefix.group}{i}:"
+        if group.PortItems:
+            items = [rows.get(id(port)) or _port_row(port) for port in group.PortItems]
+            yield prefix.item + prefix.item_sep.join(items)
+
 
-# Add PyHDLio package to path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'PyHDLio'))
+def _iter_entity(entity: PyVHDLModelEntity, indent: int) -> Iterator[str]:
+    """Yield the complete report for an entity as header and section blocks."""
+    yield f"{_prefixes(indent).indent}Entity: {entity.Identifier}"
+    yield from _iter_generics(entity, indent + 2)
+    # Ports are resolved once and shared by the flat and grouped views
+    rows = _port_rows(entity)
+    yield from _iter_ports_flat(entity, indent + 2, rows)
+    yield from _iter_ports_grouped(entity, indent + 2, rows)
 
-# pyVHDLModel imports
-from pyVHDLModel.DesignUnit import Entity as PyVHDLModelEntity
-from pyVHDLModel.Interface import GenericConstantInterfaceItem, PortSignalInterfaceItem, PortGroup as PyVHDLModelPortGroup
+
+def _iter_entities(entities: Optional[Iterable[PyVHDLModelEntity]]) -> Iterator[str]:
+    """Yield the report blocks for entities, consuming the iterable once."""
+    # None still reports as empty, as it did when a list was required
+    iterator = iter(entities or ())
+    try:
+        first = next(iterator)
+    except StopIteration:
+        yield "No entities found."
+        return
+    yield from chain.from_iterable(_iter_entity(entity, 0) for entity in chain((first,), iterator))
 
 
 def report_generics(entity: PyVHDLModelEntity, indent: int = 2) -> str:
@@ -26,21 +189,7 @@ def report_generics(entity: PyVHDLModelEntity, indent: int = 2) -> str:
     Returns:
         Formatted string report of generics
     """
-    istr = " " * indent
-    output = [f"{istr}Generics:"]
-    if entity.GenericItems:
-        for generic in entity.GenericItems:
-            name = generic.Identifiers[0] if generic.Identifiers else "unknown"
-            # Try to get our stored type string, fallback to str(Subtype)
-            if generic.Subtype is not None and hasattr(generic.Subtype, '_typeString'):
-                type_str = generic.Subtype._typeString
-            else:
-                type_str = str(generic.Subtype) if generic.Subtype else "unknown"
-            default = f" = {generic.DefaultExpression}" if generic.DefaultExpression else ""
-            output.append(f"{istr}    - {name}: {type_str}{default}")
-    else:
-        output.append(f"{istr}    None")
-    return "\n".join(output)
+    return "\n".join(_iter_generics(entity, indent))
 
 
 def report_ports_flat(entity: PyVHDLModelEntity, indent: int = 2) -> str:
@@ -53,21 +202,7 @@ def report_ports_flat(entity: PyVHDLModelEntity, indent: int = 2) -> str:
     Returns:
         Formatted string report of ports
     """
-    istr = " " * indent
-    output = [f"{istr}Ports (flat):"]
-    if entity.PortItems:
-        for port in entity.PortItems:
-            name = port.Identifiers[0] if port.Identifiers else "unknown"
-            direction = port.Mode.name.lower() if port.Mode else "unknown"
-            # Try to get our stored type string, fallback to str(Subtype)
-            if port.Subtype is not None and hasattr(port.Subtype, '_typeString'):
-                type_str = port.Subtype._typeString
-            else:
-                type_str = str(port.Subtype) if port.Subtype else "unknown"
-            output.append(f"{istr}    - {name}: {direction} {type_str}")
-    else:
-        output.append(f"{istr}    None")
-    return "\n".join(output)
+    return "\n".join(_iter_ports_flat(entity, indent))
 
 
 def report_ports_grouped(entity: PyVHDLModelEntity, indent: int = 2) -> str:
@@ -80,23 +215,7 @@ def report_ports_grouped(entity: PyVHDLModelEntity, indent: int = 2) -> str:
     Returns:
         Formatted string report of grouped ports
     """
-    istr = " " * indent
-    output = [f"{istr}Ports (grouped):"]
-    if hasattr(entity, 'PortGroups') and entity.PortGroups:
-        for i, group in enumerate(entity.PortGroups, 1):
-            output.append(f"{istr}  Group {i}:")
-            for port in group.PortItems:
-                name = port.Identifiers[0] if port.Identifiers else "unknown"
-                direction = port.Mode.name.lower() if port.Mode else "unknown"
-                # Try to get our stored type string, fallback to str(Subtype)
-                if port.Subtype is not None and hasattr(port.Subtype, '_typeString'):
-                    type_str = port.Subtype._typeString
-                else:
-                    type_str = str(port.Subtype) if port.Subtype else "unknown"
-                output.append(f"{istr}    - {name}: {direction} {type_str}")
-    else:
-        output.append(f"{istr}    None")
-    return "\n".join(output)
+    return "\n".join(_iter_ports_grouped(entity, indent))
 
 
 def report_entity(entity: PyVHDLModelEntity, indent: int = 0) -> str:
@@ -109,28 +228,33 @@ def report_entity(entity: PyVHDLModelEntity, indent: int = 0) -> str:
     Returns:
         Formatted string report of the entity
     """
-    istr = " " * indent
-    entity_name = entity.Identifier
-
-    output = [f"{istr}Entity: {entity_name}"]
-    output.append(report_generics(entity, indent + 2))
-    output.append(report_ports_flat(entity, indent + 2))
-    output.append(report_ports_grouped(entity, indent + 2))
-    return "\n".join(output)
+    return "\n".join(_iter_entity(entity, indent))
 
 
-def report_pyvhdlmodel_entities(entities: list) -> str:
+def report_pyvhdlmodel_entities(entities: Optional[Iterable[PyVHDLModelEntity]]) -> str:
     """Generate formatted report of pyVHDLModel entities.
 
     Args:
-        entities: List of pyVHDLModel Entity objects
+        entities: pyVHDLModel Entity objects (any iterable, consumed once)
 
     Returns:
         Formatted string report
     """
-    if not entities:
-        return "No entities found."
-    output = []
-    for entity in entities:
-        output.append(report_entity(entity))
-    return "\n".join(output) 
\ No newline at end of file
+    return "\n".join(_iter_entities(entities))
+
+
+def write_pyvhdlmodel_entities(entities: Optional[Iterable[PyVHDLModelEntity]],
+                               out: Optional[TextIO] = None) -> None:
+    """Write formatted report of pyVHDLModel entities to a stream.
+
+    Each entity is written section by section as it is reported, so only one
+    section (which may span several lines) is held in memory at a time. The
+    text matches report_pyvhdlmodel_entities, with a trailing newline.
+
+    Args:
+        entities: pyVHDLModel Entity objects (any iterable, consumed once)
+        out: Text stream to write to (defaults to sys.stdout)
+    """
+    if out is None:
+        out = sys.stdout
+    out.writelines(f"{line}\n" for line in _iter_entities(entities))
\ No newline at end of file